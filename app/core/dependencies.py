@@ -1,3 +1,7 @@
+import hashlib
+import time
+
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -13,11 +17,43 @@ from app.core import security
 # The 'tokenUrl' points to the login endpoint.
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-async def get_current_user(
-    session: AsyncSession = Depends(get_session), token: str = Depends(reusable_oauth2)
-) -> User:
+# --- Authenticated User Cache ---
+# Why: Every protected request would otherwise decode the JWT and issue a SELECT
+# for the user. Caching the resolved user per token lets repeat requests from
+# the same client skip both. An entry lives for at most TOKEN_CACHE_TTL_SECONDS
+# and never outlives the token's own 'exp' claim, so expired tokens still fail.
+TOKEN_CACHE_TTL_SECONDS = 60
+
+
+def _token_cache_ttu(key: bytes, value: tuple[User, float], now: float) -> float:
+    """Returns the expiry time of a cache entry: the TTL or the token's 'exp', whichever is sooner."""
+    _, token_expires_at = value
+    return min(now + TOKEN_CACHE_TTL_SECONDS, token_expires_at)
+
+
+# Why: 'timer=time.time' keeps the cache clock on the same epoch as the JWT 'exp' claim.
+_token_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_cache_ttu, timer=time.time)
+
+
+def _token_cache_key(token: str) -> bytes:
     """
-    Dependency to get the current user from a JWT token.
+    Derives a fixed-size cache key from a raw token.
+    Why: Avoids keeping full bearer tokens in memory as dictionary keys.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_cached_token(token: str) -> None:
+    """
+    Drops a token from the authenticated user cache.
+    Call this when a token must stop working immediately (e.g., logout or password change).
+    """
+    _token_cache.pop(_token_cache_key(token), None)
+
+
+async def _resolve_user_from_token(session: AsyncSession, token: str) -> User:
+    """
+    Resolves the user a JWT token belongs to, serving repeat tokens from the cache.
     Raises HTTPException 401 if the token is invalid or the user does not exist.
     """
     credentials_exception = HTTPException(
@@ -26,7 +62,16 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    email: EmailStr | None = security.decode_access_token(token)
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    payload = security.decode_access_token_claims(token)
+    if payload is None:
+        raise credentials_exception
+
+    email: EmailStr | None = payload.get("sub")
     if not email:
         raise credentials_exception
     
@@ -34,20 +79,36 @@ async def get_current_user(
     user = await user_service.get_user_by_email(session=session, email=email)
     if user is None:
         raise credentials_exception
+
+    token_expires_at = payload.get("exp", time.time() + TOKEN_CACHE_TTL_SECONDS)
+    _token_cache[cache_key] = (user, token_expires_at)
     
     return user
 
+async def get_current_user(
+    session: AsyncSession = Depends(get_session), token: str = Depends(reusable_oauth2)
+) -> User:
+    """
+    Dependency to get the current user from a JWT token.
+    Raises HTTPException 401 if the token is invalid or the user does not exist.
+
+    Why: This is kept separate so that we can have endpoints that work for
+    inactive users if needed (e.g., an endpoint to reactivate an account).
+    """
+    return await _resolve_user_from_token(session, token)
+
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session), token: str = Depends(reusable_oauth2)
 ) -> User:
     """
     Dependency to get the current *active* user.
-    Raises HTTPException 403 if the user is marked as inactive.
+    Raises HTTPException 401 if the token is invalid, or 403 if the user is marked as inactive.
     
-    Why: This is a separate dependency so that we can have endpoints
-    that work for inactive users if needed (e.g., an endpoint to reactivate an account).
+    Why: This resolves the user itself rather than depending on get_current_user,
+    so each protected request resolves one fewer node in FastAPI's dependency graph.
     Most protected endpoints should depend on this one.
     """
+    current_user = await _resolve_user_from_token(session, token)
     if not current_user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
     return current_user
@@ -1,18 +1,36 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+import orjson
 from pydantic import BaseModel, EmailStr
 
 from config.settings import settings
 
 # --- Password Hashing ---
 
-# Why: Use passlib's CryptContext for password hashing.
-# 'bcrypt' is the chosen scheme for its strength and resistance to brute-force attacks.
-# 'deprecated="auto"' ensures that older hashes (if any other schemes were used) can still be validated.
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Why: 'bcrypt' is the chosen scheme for its strength and resistance to brute-force attacks.
+# We call the bcrypt C extension directly rather than going through passlib's
+# dispatch layer. Hashes keep the standard '$2b$' format, so hashes created
+# earlier through passlib still verify unchanged.
+# 12 rounds matches the cost factor passlib used by default.
+BCRYPT_ROUNDS = 12
+
+# Why: The bcrypt algorithm only considers the first 72 bytes of a password.
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Why: A bcrypt hash or verify takes hundreds of milliseconds of CPU. Running it
+# directly in an 'async def' route blocks the event loop and stalls every other
+# request on the worker. The bcrypt C extension releases the GIL, so a dedicated
+# thread pool lets hashing proceed in parallel while the loop stays responsive.
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,7 +44,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if the password is correct, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    # Why: Truncate exactly as get_password_hash does so long passwords verify consistently.
+    password_bytes = plain_password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
 
 
 def get_password_hash(password: str) -> str:
@@ -40,16 +60,60 @@ def get_password_hash(password: str) -> str:
         The resulting hashed password.
     """
     # Why: The bcrypt algorithm has a maximum password length of 72 bytes.
-    # Passlib's bcrypt handler will raise a ValueError if the password is too long.
-    # To prevent this, we encode the password to bytes and truncate it to 72
-    # before hashing. This is the standard way to handle this limitation.
+    # We encode the password to bytes and truncate it to 72 before hashing
+    # so over-long input never raises. This is the standard way to handle this limitation.
     password_bytes = password.encode('utf-8')
-    truncated_password_bytes = password_bytes[:72]
-    return pwd_context.hash(truncated_password_bytes)
+    truncated_password_bytes = password_bytes[:BCRYPT_MAX_PASSWORD_BYTES]
+    hashed = bcrypt.hashpw(truncated_password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed.decode('utf-8')
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Async variant of `verify_password` that runs in the bcrypt thread pool.
+    Use this from async code so the event loop is not blocked.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Async variant of `get_password_hash` that runs in the bcrypt thread pool.
+    Use this from async code so the event loop is not blocked.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, get_password_hash, password)
 
 
 # --- JWT Token Schemas & Functions ---
 
+# Why: PyJWT signs and verifies HS256 through hashlib's OpenSSL-backed HMAC.
+# The key is encoded once here instead of on every encode/decode call.
+_SECRET_KEY_BYTES = settings.SECRET_KEY.encode("utf-8")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Encodes bytes as unpadded base64url, as required by the JWT spec."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Why: For HS256 the JOSE header never changes, so its encoded segment is built once.
+_HS256_HEADER_SEGMENT = _b64url_encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+def _encode_hs256(claims: dict) -> str:
+    """
+    Signs a set of claims as an HS256 JWT without going through PyJWT.
+
+    Why: Token issuance only needs the payload serialized and one HMAC computed.
+    This skips PyJWT's per-call header serialization and key preparation.
+    The output is a standard compact JWT that PyJWT decodes as usual.
+    """
+    signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url_encode(orjson.dumps(claims))
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
 class Token(BaseModel):
     """Schema for the JWT access token returned on successful login."""
     access_token: str
@@ -77,11 +141,31 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    # Why: The 'exp' claim is a NumericDate (seconds since the epoch).
+    to_encode.update({"exp": int(expire.timestamp())})
+    if settings.ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def decode_access_token_claims(token: str) -> Optional[dict]:
+    """
+    Decodes and verifies a JWT access token, returning its full set of claims.
+
+    Args:
+        token: The JWT token string.
+
+    Returns:
+        The decoded claims (e.g., 'sub', 'exp') if the token is valid, otherwise None.
+    """
+    try:
+        return jwt.decode(token, _SECRET_KEY_BYTES, algorithms=[settings.ALGORITHM])
+    except jwt.PyJWTError:
+        # This catches any error from PyJWT (e.g., expired token, invalid signature)
+        return None
+
+
 def decode_access_token(token: str) -> Optional[EmailStr]:
     """
     Decodes a JWT access token to extract the user's email.
@@ -93,13 +177,9 @@ def decode_access_token(token: str) -> Optional[EmailStr]:
         The user's email if the token is valid, otherwise None.
         In a real application, this would raise specific exceptions.
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: Optional[EmailStr] = payload.get("sub")
-        if email is None:
-            return None
-        # Here you could load the user from DB and attach to the request
-        return email
-    except JWTError:
-        # This catches any error from jose (e.g., expired token, invalid signature)
+    payload = decode_access_token_claims(token)
+    if payload is None:
         return None
+    email: Optional[EmailStr] = payload.get("sub")
+    # Here you could load the user from DB and attach to the request
+    return email
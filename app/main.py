@@ -1,5 +1,7 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import orjson
 
 from app.database import create_db_and_tables
 from app.routers import auth, tasks, agent
@@ -20,10 +22,13 @@ async def lifespan(app: FastAPI):
     # Any shutdown logic would go here
 
 # Why: Initialize the FastAPI application with a title, version, and the lifespan context manager.
+# 'ORJSONResponse' encodes every JSON response with orjson's C core instead of
+# the stdlib json module, and handles datetime/UUID values natively.
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # --- API Routers ---
@@ -36,9 +41,14 @@ app.include_router(agent.router, prefix="/agent")
 
 # --- Root Endpoint ---
 # Why: A root endpoint that provides a simple health check or welcome message.
+# It is typically the most-hit endpoint (load balancer probes) and its body never
+# changes, so the JSON is rendered once at startup and returned as raw bytes,
+# bypassing response validation and encoding on every hit.
+ROOT_RESPONSE_BODY = orjson.dumps({"message": f"Welcome to {settings.APP_NAME} v{settings.APP_VERSION}"})
+
 @app.get("/", tags=["Health Check"])
 async def root():
     """
     Root endpoint providing a welcome message and application version.
     """
-    return {"message": f"Welcome to {settings.APP_NAME} v{settings.APP_VERSION}"}
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
@@ -1,5 +1,9 @@
 import asyncio
-import json
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Optional
+
+import orjson
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel
 from starlette.responses import StreamingResponse
@@ -14,6 +18,64 @@ class AgentRunRequest(BaseModel):
     """Schema for the request body of the agent execution endpoint."""
     prompt: str
     
+# Why: The start and end events never change, so their SSE frames are serialized once.
+# Frames are bytes so StreamingResponse can send them without an extra encode step.
+TASK_START_FRAME = b"event: task_start\ndata: " + orjson.dumps({"message": "Agent task execution started..."}) + b"\n\n"
+TASK_END_FRAME = b"event: task_end\ndata: " + orjson.dumps({"message": "Task completed successfully!"}) + b"\n\n"
+
+# Why: Writing one SSE frame per token means one ASGI send, one chunked write and
+# one TCP segment for a few bytes of payload. When the agent produces tokens
+# faster than the client drains them, the tokens already waiting are flushed
+# together in a single write of up to SSE_BATCH_MAX_TOKENS frames. Each token
+# keeps its own 'data:' frame, so clients see the same events as before.
+SSE_BATCH_MAX_TOKENS = 4
+
+
+def _token_frame(token: str) -> bytes:
+    """
+    Builds the SSE 'data:' frame for a single token.
+    """
+    return b"data: " + orjson.dumps({"token": token}) + b"\n\n"
+
+
+async def _simulate_agent_tokens(prompt: str, user: User, queue: "asyncio.Queue[Optional[str]]"):
+    """
+    Simulates an agent producing tokens, pushing each one onto the queue.
+    A trailing None marks the end of the stream.
+    """
+    try:
+        # Why: Stream back the response word by word to simulate token generation.
+        response = f"Simulating execution for prompt: '{prompt}' on behalf of user '{user.email}'. "
+        for word in response.split():
+            await queue.put(word)
+            await asyncio.sleep(0.1)
+    finally:
+        # Why: Always signal the end, even on failure, so the consumer never waits forever.
+        await queue.put(None)
+
+
+async def _coalesce_tokens(queue: "asyncio.Queue[Optional[str]]") -> AsyncIterator[list[str]]:
+    """
+    Groups tokens from the queue into batches of at most SSE_BATCH_MAX_TOKENS.
+
+    Why: Only tokens that are already queued join the batch, so a batch never
+    waits for more tokens to arrive. A producer slower than the client gets one
+    token per write with no added latency.
+    """
+    while True:
+        token = await queue.get()
+        if token is None:
+            return
+        batch = [token]
+        while len(batch) < SSE_BATCH_MAX_TOKENS and not queue.empty():
+            token = queue.get_nowait()
+            if token is None:
+                yield batch
+                return
+            batch.append(token)
+        yield batch
+
+
 # Why: A Server-Sent Events (SSE) endpoint is crucial for agentic applications.
 # It allows the server to push updates to the client in real-time as the agent
 # "thinks" or executes a long-running task. This provides a much better user
@@ -21,26 +83,36 @@ class AgentRunRequest(BaseModel):
 async def fake_agent_response_generator(prompt: str, user: User):
     """
     An async generator that simulates a long-running agent task,
-    yielding formatted SSE messages.
+    yielding formatted SSE messages as UTF-8 bytes.
     """
     # Event: Task Begin
     # Why: Send a structured event to the client indicating the task has started.
     # A client could use the 'event' field to trigger specific UI updates.
-    yield f"event: task_start\ndata: {json.dumps({'message': 'Agent task execution started...'})}\n\n"
+    yield TASK_START_FRAME
     await asyncio.sleep(1)
 
     # Event: Message Stream
-    # Why: Stream back the response word by word to simulate token generation.
-    response = f"Simulating execution for prompt: '{prompt}' on behalf of user '{user.email}'. "
-    for word in response.split():
-        yield f"data: {json.dumps({'token': word})}\n\n"
-        await asyncio.sleep(0.1)
+    # Why: The agent produces tokens in the background while we flush them in batches.
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    producer = asyncio.create_task(_simulate_agent_tokens(prompt, user, queue))
+    try:
+        async for batch in _coalesce_tokens(queue):
+            yield b"".join(map(_token_frame, batch))
+        # Why: Re-raise a producer failure here, so a failed task never reports task_end.
+        await producer
+    finally:
+        # Why: Stop the producer if the client disconnects mid-stream, and wait
+        # for it so it never outlives the response.
+        if not producer.done():
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
 
     await asyncio.sleep(1)
 
     # Event: Task End
     # Why: Signal to the client that the task is complete.
-    yield f"event: task_end\ndata: {json.dumps({'message': 'Task completed successfully!'})}\n\n"
+    yield TASK_END_FRAME
 
 @router.post("/run", status_code=status.HTTP_200_OK)
 async def agent_run(
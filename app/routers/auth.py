@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import create_access_token, verify_password, Token
+from app.core.security import averify_password, create_access_token, Token
 from app.database import get_session
 from app.models.user import UserCreate, UserRead
 from app.services import user_service
@@ -25,7 +25,9 @@ async def register_user(
     # is encapsulated in the service layer. The router's job is to handle
     # the HTTP request/response and call the appropriate service.
     user = await user_service.create_user(session=session, user_in=user_in)
-    return UserRead.from_orm(user)
+    # Why: 'response_model=UserRead' already validates the ORM object into the
+    # public schema, so we return it as-is instead of converting it twice.
+    return user
 
 
 @router.post("/login", response_model=Token)
@@ -44,7 +46,7 @@ async def login_for_access_token(
     
     # Why: We check if the user exists AND if the provided password is correct.
     # It's crucial to use the verified security function for this.
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await averify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -1,11 +1,26 @@
 from typing import List, Optional
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete, insert, lambda_stmt, update
 from sqlmodel import select, SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.task import Task, TaskCreate, TaskUpdate
 from app.models.user import User
 
+# Why: These reads back every task listing and lookup. Wrapping them in
+# 'lambda_stmt' lets SQLAlchemy cache the statement and its compiled SQL by the
+# lambda's code location, skipping statement construction and cache-key
+# generation per call. All varying values are explicit bound parameters.
+_tasks_for_owner_statement = lambda_stmt(
+    lambda: select(Task)
+    .where(Task.owner_id == bindparam("owner_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_task_for_owner_statement = lambda_stmt(
+    lambda: select(Task).where(Task.id == bindparam("task_id"), Task.owner_id == bindparam("owner_id"))
+)
+
 async def create_task_for_user(
     session: AsyncSession, *, task_in: TaskCreate, owner: User
 ) -> Task:
@@ -20,19 +35,23 @@ async def create_task_for_user(
     Returns:
         The newly created task object.
     """
-    # Why: We manually construct the Task object, ensuring all required fields
-    # including the owner_id are explicitly set from trusted sources.
+    # Why: We explicitly set every column, including the owner_id, from trusted sources.
     # This prevents validation errors and correctly associates the task with its owner.
-    db_task = Task(
-        title=task_in.title,
-        description=task_in.description,
-        status=task_in.status,
-        owner_id=owner.id  # Explicitly set owner_id from the authenticated user
+    # 'RETURNING' hands back the inserted row (with its generated id) in the same
+    # round-trip, so no refresh SELECT is needed after the commit.
+    statement = (
+        insert(Task)
+        .values(
+            title=task_in.title,
+            description=task_in.description,
+            status=task_in.status,
+            owner_id=owner.id,  # Explicitly set owner_id from the authenticated user
+        )
+        .returning(Task)
     )
-    
-    session.add(db_task)
+    result = await session.exec(statement)
+    db_task = result.scalar_one()
     await session.commit()
-    await session.refresh(db_task)
     return db_task
 
 async def get_tasks_for_user(
@@ -50,9 +69,10 @@ async def get_tasks_for_user(
     Returns:
         A list of task objects.
     """
-    statement = select(Task).where(Task.owner_id == owner.id).offset(skip).limit(limit)
-    result = await session.exec(statement)
-    return result.all()
+    result = await session.exec(
+        _tasks_for_owner_statement, params={"owner_id": owner.id, "skip": skip, "limit": limit}
+    )
+    return result.scalars().all()
 
 async def get_task_for_user(
     session: AsyncSession, *, task_id: int, owner: User
@@ -71,9 +91,10 @@ async def get_task_for_user(
     Raises:
         HTTPException: If the task is not found or not owned by the user.
     """
-    statement = select(Task).where(Task.id == task_id, Task.owner_id == owner.id)
-    result = await session.exec(statement)
-    task = result.first()
+    result = await session.exec(
+        _task_for_owner_statement, params={"task_id": task_id, "owner_id": owner.id}
+    )
+    task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
     return task
@@ -97,21 +118,30 @@ async def update_task_for_user(
     Raises:
         HTTPException: If the task is not found or not owned by the user.
     """
-    db_task = await get_task_for_user(session=session, task_id=task_id, owner=owner)
-    
-    # Why: Using model_dump with exclude_unset=True ensures we only get the data
-    # that was explicitly provided in the PATCH request.
-    update_data = task_update.model_dump(exclude_unset=True)
-    
-    # Why: Iterating and setting attributes individually is a more robust and
-    # explicit way to apply updates than the deprecated sqlmodel_update method.
-    # This prevents unexpected behavior and ensures only the intended fields are changed.
-    for key, value in update_data.items():
-        setattr(db_task, key, value)
-    
-    session.add(db_task)
+    # Why: 'model_fields_set' holds only the fields explicitly provided in the
+    # PATCH request, so reading just those avoids dumping the whole model.
+    update_data = {field: getattr(task_update, field) for field in task_update.model_fields_set}
+
+    # Why: An empty PATCH changes nothing, and an UPDATE needs at least one column.
+    if not update_data:
+        return await get_task_for_user(session=session, task_id=task_id, owner=owner)
+
+    # Why: A single UPDATE ... WHERE id AND owner_id ... RETURNING applies the
+    # changes, enforces ownership, and returns the updated row in one round-trip.
+    # This replaces the separate fetch, UPDATE, and refresh SELECT.
+    # Only the intended fields are changed.
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.owner_id == owner.id)
+        .values(**update_data)
+        .returning(Task)
+    )
+    result = await session.exec(statement)
+    db_task = result.scalar_one_or_none()
+    if db_task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
     await session.commit()
-    await session.refresh(db_task)
     return db_task
 
 async def delete_task_for_user(session: AsyncSession, *, task_id: int, owner: User):
@@ -126,8 +156,16 @@ async def delete_task_for_user(session: AsyncSession, *, task_id: int, owner: Us
     Raises:
         HTTPException: If the task is not found or not owned by the user.
     """
-    task = await get_task_for_user(session=session, task_id=task_id, owner=owner)
-    
-    await session.delete(task)
+    # Why: DELETE ... WHERE id AND owner_id ... RETURNING enforces ownership and
+    # deletes in one round-trip, instead of fetching the task first.
+    statement = (
+        delete(Task)
+        .where(Task.id == task_id, Task.owner_id == owner.id)
+        .returning(Task.id)
+    )
+    result = await session.exec(statement)
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
     await session.commit()
     return {"ok": True}
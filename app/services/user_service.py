@@ -1,11 +1,22 @@
 from fastapi import HTTPException, status
 from pydantic import EmailStr
+from sqlalchemy import bindparam, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.security import aget_password_hash
 from app.models.user import User, UserCreate
 
+# Why: This lookup runs on every login and every uncached authenticated request.
+# 'lambda_stmt' caches the statement and its compiled SQL by the lambda's code
+# location, so neither the select() nor its cache key is rebuilt per call.
+# The unique 'ix_user_email' index turns it into a single index probe, and
+# LIMIT 1 lets Postgres stop at the first match.
+_user_by_email_statement = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email")).limit(1)
+)
+
 async def get_user_by_email(session: AsyncSession, email: EmailStr) -> User | None:
     """
     Retrieves a user by their email address from the database.
@@ -17,9 +28,8 @@ async def get_user_by_email(session: AsyncSession, email: EmailStr) -> User | No
     Returns:
         The User object if found, otherwise None.
     """
-    statement = select(User).where(User.email == email)
-    result = await session.execute(statement)
-    return result.scalars().first()
+    result = await session.exec(_user_by_email_statement, params={"email": email})
+    return result.scalar_one_or_none()
 
 
 async def create_user(session: AsyncSession, user_in: UserCreate) -> User:
@@ -36,27 +46,30 @@ async def create_user(session: AsyncSession, user_in: UserCreate) -> User:
     Raises:
         HTTPException: If a user with the same email already exists.
     """
-    # Why: First, check if a user with this email already exists to prevent duplicates.
-    existing_user = await get_user_by_email(session, user_in.email)
-    if existing_user:
+    # Why: Hash the password before storing it. Never store plain text passwords.
+    # The hash runs in a worker thread so the event loop is not blocked.
+    hashed_password = await aget_password_hash(user_in.password)
+
+    # Why: A single INSERT ... ON CONFLICT DO NOTHING RETURNING both creates the
+    # user and detects duplicates in one round-trip. Unlike a separate
+    # "check, then insert", it cannot race with a concurrent registration:
+    # the unique index on 'email' is the arbiter, and no row comes back on conflict.
+    # We explicitly exclude the plain password and set the hashed_password;
+    # is_active defaults to True as defined in the model.
+    statement = (
+        insert(User)
+        .values(email=user_in.email, hashed_password=hashed_password)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User)
+    )
+    result = await session.exec(statement)
+    db_user = result.scalar_one_or_none()
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A user with this email already exists.",
         )
 
-    # Why: Hash the password before storing it. Never store plain text passwords.
-    hashed_password = get_password_hash(user_in.password)
-
-    # Why: Create a User model instance from the input data.
-    # We explicitly exclude the plain password and set the hashed_password.
-    db_user = User(
-        email=user_in.email,
-        hashed_password=hashed_password
-        # is_active defaults to True as defined in the model
-    )
-
-    session.add(db_user)
     await session.commit()
-    await session.refresh(db_user)
 
     return db_user
@@ -0,0 +1,35 @@
+"""
+Writes a snapshot of the validated application settings to a JSON file.
+
+Usage:
+    python -m config._prebuild <path>
+
+Why: Run once when a container starts (see docker-entrypoint.sh), so every
+worker process can load the already-validated values through
+SETTINGS_SNAPSHOT_PATH instead of re-parsing .env and re-running validation.
+The snapshot contains secrets, so it is written readable by its owner only and
+is never baked into an image.
+"""
+import json
+import os
+import sys
+
+from config.settings import Settings
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 2:
+        print("Usage: python -m config._prebuild <path>", file=sys.stderr)
+        return 2
+
+    # Why: Build from the environment directly, never from an existing snapshot.
+    data = Settings().model_dump(mode="json")
+
+    fd = os.open(argv[1], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as snapshot_file:
+        json.dump(data, snapshot_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
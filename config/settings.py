@@ -1,7 +1,18 @@
+import json
+import os
+from functools import cached_property, lru_cache
+from urllib.parse import urlsplit
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, PostgresDsn, field_validator
+from pydantic import Field, field_validator
 from typing import Optional
 
+# Why: The quote characters stripped from string settings, as a set for O(1) membership checks.
+_QUOTES = frozenset("'\"")
+
+# Why: The URL schemes accepted for PostgreSQL connection strings, with or without a '+driver' suffix.
+_POSTGRES_SCHEMES = frozenset(("postgres", "postgresql"))
+
 class Settings(BaseSettings):
     """
     Manages application-wide settings, loading from environment variables.
@@ -14,10 +25,20 @@ class Settings(BaseSettings):
     DEBUG: bool = Field(default=False, description="Enable debug mode (DO NOT use in production).")
 
     # --- Database Settings ---
-    # Why: Connection string for the primary database. Must be a valid PostgreSQL DSN.
+    # Why: Connection string for the primary database. Must be a PostgreSQL URL.
     # It's a required field; the app will not start without it.
-    DATABASE_URL: PostgresDsn = Field(..., description="PostgreSQL connection URL for the application (async).")
-    ALEMBIC_DATABASE_URL: Optional[PostgresDsn] = Field(None, description="PostgreSQL connection URL for Alembic (sync).")
+    # These are kept as plain strings: SQLAlchemy and the drivers parse them anyway,
+    # so only the scheme is checked here (see 'check_postgres_scheme').
+    DATABASE_URL: str = Field(..., description="PostgreSQL connection URL for the application (async).")
+    ALEMBIC_DATABASE_URL: Optional[str] = Field(None, description="PostgreSQL connection URL for Alembic (sync).")
+
+    # Why: The connection pool is per worker process, so Postgres sees up to
+    # workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections. At the defaults
+    # (60 per worker) two workers already exceed Postgres' default
+    # 'max_connections=100'. Lower these, or put PgBouncer in front, to fit the
+    # server's budget when running several workers or replicas.
+    DB_POOL_SIZE: int = Field(default=20, description="Connections kept open in each worker's pool.")
+    DB_MAX_OVERFLOW: int = Field(default=40, description="Extra connections each worker may open under load.")
 
     # --- Security & JWT Settings ---
     # Why: Manages the secret key for signing JWTs and token lifetime.
@@ -32,13 +53,94 @@ class Settings(BaseSettings):
         """
         Strips leading/trailing single and double quotes from a string.
         """
-        return v.strip("'\"")
+        # Why: Values are almost never quoted, so check the ends first and only
+        # build a stripped copy when a quote is actually present.
+        if v and (v[0] in _QUOTES or v[-1] in _QUOTES):
+            return v.strip("'\"")
+        return v
+
+    @field_validator("DATABASE_URL", "ALEMBIC_DATABASE_URL")
+    @classmethod
+    def check_postgres_scheme(cls, v: Optional[str]) -> Optional[str]:
+        """
+        Ensures a connection string is a PostgreSQL URL, e.g. 'postgresql://' or 'postgresql+asyncpg://'.
+        """
+        if v is None:
+            return v
+        scheme, separator, _ = v.partition("://")
+        if not separator or (scheme not in _POSTGRES_SCHEMES and not scheme.startswith("postgresql+")):
+            raise ValueError("must be a PostgreSQL URL (e.g., 'postgresql://' or 'postgresql+asyncpg://')")
+        return v
+
+    @cached_property
+    def sync_dsn(self) -> str:
+        """
+        The database URL for synchronous drivers (e.g., Alembic with psycopg2).
+
+        Why: Built from the split URL components rather than by text
+        substitution on the full URL, so a '+asyncpg' inside a password cannot be
+        mangled. The driver suffix and all query parameters are dropped.
+        Credentials stay percent-encoded exactly as they were given.
+        """
+        parts = urlsplit(self.ALEMBIC_DATABASE_URL or self.DATABASE_URL)
+        return f"postgresql://{parts.netloc}{parts.path}"
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding='utf-8',
         case_sensitive=False, # Allows uppercase environment variables to map to lowercase fields
+        frozen=True, # Settings are read-only once loaded; no assignment validation is ever needed
+        extra='ignore', # Unrelated variables in .env are skipped instead of collected as extras
+        validate_default=False, # Literal defaults (e.g., APP_NAME) are already correctly typed
     )
 
-# Instantiate the settings object that will be used across the application.
-settings = Settings()
+# Why: Names an optional JSON snapshot of already-validated settings (written by
+# 'python -m config._prebuild'). In containers the environment is fixed for the
+# container's lifetime, so workers can load the snapshot instead of re-reading
+# .env and re-running every validator on each start.
+SETTINGS_SNAPSHOT_ENV_VAR = "SETTINGS_SNAPSHOT_PATH"
+
+
+def _load_settings_snapshot(path: str) -> Optional[Settings]:
+    """
+    Loads a settings snapshot, or returns None if it is missing, unreadable or stale.
+    """
+    try:
+        with open(path, encoding="utf-8") as snapshot_file:
+            data = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return None
+    # Why: A snapshot written for a different set of fields must not be trusted.
+    if not isinstance(data, dict) or data.keys() != Settings.model_fields.keys():
+        return None
+    # Why: 'model_construct' skips validation; the data was validated when the snapshot was written.
+    return Settings.model_construct(**data)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the application settings, building them on first use.
+
+    Why: Reading the .env file and running every field validator happens once
+    per process; every later call reuses the same parsed Settings instance.
+    If a snapshot is configured and valid, even that first build is skipped.
+    """
+    snapshot_path = os.environ.get(SETTINGS_SNAPSHOT_ENV_VAR)
+    if snapshot_path:
+        snapshot = _load_settings_snapshot(snapshot_path)
+        if snapshot is not None:
+            return snapshot
+    return Settings()
+
+
+def __getattr__(name: str):
+    """
+    Lazily resolves the module-level 'settings' object (PEP 562).
+
+    Why: Keeps 'from config.settings import settings' working across the
+    application while deferring Settings() until it is first needed.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,10 +5,16 @@ cd /home/appuser/app
 echo "Waiting for the database to be ready..."
 sleep 10
 
+echo "Snapshotting validated settings..."
+# Why: The environment is fixed for the container's lifetime, so settings are
+# validated once here and every process below loads the snapshot instead.
+export SETTINGS_SNAPSHOT_PATH=/tmp/.settings-snapshot.json
+/home/appuser/app/.venv/bin/python -m config._prebuild "$SETTINGS_SNAPSHOT_PATH"
+
 echo "Applying database migrations..."
 # Use the python from the venv directly
 /home/appuser/app/.venv/bin/python -m alembic upgrade head
 
 echo "Starting FastAPI application..."
 # Use the python from the venv directly
-exec /home/appuser/app/.venv/bin/python -m uvicorn app.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+exec /home/appuser/app/.venv/bin/python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
\ No newline at end of file
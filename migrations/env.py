@@ -1,9 +1,5 @@
 import os
 import sys
-from logging.config import fileConfig
-
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
 
 from alembic import context
 
@@ -11,34 +7,42 @@ from alembic import context
 # access to the values within the .ini file in use.
 config = context.config
 
-# Interpret the config file for Python logging.
-# This line sets up loggers basically.
-fileConfig(config.config_file_name)
-
 # Add the app directory to the path so we can import the models
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-from app.models import user, task  # noqa
-from sqlmodel import SQLModel
-target_metadata = SQLModel.metadata
+from migrations.runtime import configure_logging, get_engine
+
+# Interpret the config file for Python logging.
+# This line sets up loggers basically, once per process.
+configure_logging(config.config_file_name)
+
+
+def get_target_metadata():
+    """Return the models' MetaData object for 'autogenerate' support.
+
+    The models (and with them SQLModel and the SQLAlchemy mappers) are
+    imported here rather than at module load, so only the code paths that
+    actually consume the metadata pay for the import.
+
+    """
+    from app.models import user, task  # noqa
+    from sqlmodel import SQLModel
+    return SQLModel.metadata
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
-from config.settings import settings
+from config.settings import get_settings
+settings = get_settings()
 # Why: Alembic runs synchronously, so it needs a sync database driver.
-# We get the async URL from the settings, which might contain '+asyncpg'
-# and async-specific query parameters (e.g., '?ssl=true').
-# We convert it to a sync-compatible URL for psycopg2.
-db_url = settings.ALEMBIC_DATABASE_URL or settings.DATABASE_URL
-# 1. Convert the Pydantic DSN object to a string.
-# 2. Remove the '+asyncpg' driver part.
-# 3. Split the URL at the query string '?' and take the first part to remove all query params.
-sync_db_url = str(db_url).replace("+asyncpg", "").split("?")[0]
-config.set_main_option('sqlalchemy.url', sync_db_url)
+# The async URL from the settings might contain '+asyncpg' and async-specific
+# query parameters (e.g., '?ssl=true'); 'sync_dsn' is the psycopg2-compatible
+# URL rebuilt from the parsed DSN without either.
+# '%' is doubled because Alembic's config applies ConfigParser interpolation,
+# and percent-encoded credentials would otherwise be misread.
+config.set_main_option('sqlalchemy.url', settings.sync_dsn.replace("%", "%%"))
 
 
 def run_migrations_offline():
@@ -56,7 +60,7 @@ def run_migrations_offline():
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=get_target_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -68,19 +72,16 @@ def run_migrations_offline():
 def run_migrations_online():
     """Run migrations in 'online' mode.
 
-    In this scenario we need to create an Engine
+    In this scenario we need an Engine
     and associate a connection with the context.
+    The Engine is cached per URL, so repeated runs in one process reuse it.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = get_engine(config.get_main_option("sqlalchemy.url"))
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=get_target_metadata()
         )
 
         with context.begin_transaction():
@@ -0,0 +1,36 @@
+"""
+Process-wide helpers for migrations/env.py.
+
+Why: Alembic executes env.py as a fresh module on every command, so anything
+cached inside env.py itself is rebuilt each time. Living in a regular module,
+these caches survive across commands run in the same process (e.g., a test
+suite or CI job calling 'alembic upgrade'/'check'/'downgrade' back-to-back).
+"""
+from functools import lru_cache
+from logging.config import fileConfig
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+
+@lru_cache(maxsize=4)
+def configure_logging(config_file_name: str) -> None:
+    """
+    Applies the logging configuration from the Alembic .ini file once per process.
+    """
+    fileConfig(config_file_name)
+
+
+@lru_cache(maxsize=4)
+def get_engine(url: str) -> Engine:
+    """
+    Returns an engine for the given sync database URL, creating it on first use.
+
+    Why: Alembic only ever uses one connection at a time, so 'StaticPool' holds
+    exactly one and hands it to every checkout, with no pool bookkeeping on top.
+    Together with the cache, the TCP/TLS handshake and the engine/dialect setup
+    are paid once and every later migration command reuses the same connection.
+    'pool_pre_ping' reconnects if that connection went stale in between.
+    """
+    return create_engine(url, poolclass=StaticPool, pool_pre_ping=True)
@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+from app.models.user import User
+from app.routers import agent
+
+USER = User(id=1, email="user@example.com", hashed_password="not-a-real-hash")
+
+
+@pytest.fixture(autouse=True)
+def no_delays(monkeypatch):
+    """Keeps the simulated pauses from slowing the tests down, while still yielding to the loop."""
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args, **kwargs):
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+
+def _token_events(chunk: bytes) -> list[str]:
+    """Splits a written chunk into its SSE events and returns their tokens."""
+    events = [event for event in chunk.decode().split("\n\n") if event]
+    return [json.loads(event.removeprefix("data: "))["token"] for event in events]
+
+
+async def _collect(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+def test_stream_sends_start_tokens_and_end():
+    chunks = asyncio.run(_collect(agent.fake_agent_response_generator("hi", USER)))
+
+    assert chunks[0] == agent.TASK_START_FRAME
+    assert chunks[-1] == agent.TASK_END_FRAME
+    tokens = [token for chunk in chunks[1:-1] for token in _token_events(chunk)]
+    assert tokens == "Simulating execution for prompt: 'hi' on behalf of user 'user@example.com'.".split()
+
+
+def test_slow_producer_gets_one_token_per_write():
+    chunks = asyncio.run(_collect(agent.fake_agent_response_generator("hi", USER)))
+
+    assert all(len(_token_events(chunk)) == 1 for chunk in chunks[1:-1])
+
+
+def test_queued_tokens_are_written_together(monkeypatch):
+    async def burst_producer(prompt, user, queue):
+        for token in ["a", "b", "c", "d", "e", "f"]:
+            queue.put_nowait(token)
+        queue.put_nowait(None)
+
+    monkeypatch.setattr(agent, "_simulate_agent_tokens", burst_producer)
+
+    chunks = asyncio.run(_collect(agent.fake_agent_response_generator("hi", USER)))
+
+    assert [_token_events(chunk) for chunk in chunks[1:-1]] == [["a", "b", "c", "d"], ["e", "f"]]
+
+
+def test_producer_failure_is_raised_instead_of_task_end(monkeypatch):
+    async def failing_producer(prompt, user, queue):
+        try:
+            await queue.put("partial")
+            await asyncio.sleep(0)
+            raise RuntimeError("agent crashed")
+        finally:
+            await queue.put(None)
+
+    monkeypatch.setattr(agent, "_simulate_agent_tokens", failing_producer)
+    chunks = []
+
+    async def consume():
+        async for chunk in agent.fake_agent_response_generator("hi", USER):
+            chunks.append(chunk)
+
+    with pytest.raises(RuntimeError, match="agent crashed"):
+        asyncio.run(consume())
+    assert agent.TASK_END_FRAME not in chunks
+    assert _token_events(chunks[-1]) == ["partial"]
+
+
+def test_disconnect_cancels_and_awaits_the_producer(monkeypatch):
+    producer_state = {}
+
+    async def endless_producer(prompt, user, queue):
+        try:
+            while True:
+                await queue.put("token")
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            producer_state["cancelled"] = True
+            raise
+        finally:
+            producer_state["finished"] = True
+
+    monkeypatch.setattr(agent, "_simulate_agent_tokens", endless_producer)
+
+    async def disconnect_after_first_tokens():
+        stream = agent.fake_agent_response_generator("hi", USER)
+        assert await anext(stream) == agent.TASK_START_FRAME
+        await anext(stream)
+        # Why: Closing the generator is what Starlette does when the client goes away.
+        await stream.aclose()
+        # Why: Checked before the event loop shuts down, which would cancel leftover tasks anyway.
+        assert producer_state == {"cancelled": True, "finished": True}
+
+    asyncio.run(disconnect_after_first_tokens())
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from cachetools import TLRUCache
+
+from app.core import dependencies, security
+from app.models.user import User
+
+
+class FakeClock:
+    """A controllable stand-in for time.time, used as the cache timer."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Swaps in an empty token cache driven by a fake clock."""
+    clock = FakeClock(1_000_000.0)
+    cache = TLRUCache(maxsize=16, ttu=dependencies._token_cache_ttu, timer=clock)
+    monkeypatch.setattr(dependencies, "_token_cache", cache)
+    return clock
+
+
+@pytest.fixture
+def user_lookups(monkeypatch):
+    """Replaces the database lookup and records every email it is asked for."""
+    lookups = []
+
+    async def get_user_by_email(session, email):
+        lookups.append(email)
+        return User(id=1, email=email, hashed_password="not-a-real-hash")
+
+    monkeypatch.setattr(dependencies.user_service, "get_user_by_email", get_user_by_email)
+    return lookups
+
+
+def _resolve(token: str) -> User:
+    return asyncio.run(dependencies._resolve_user_from_token(session=None, token=token))
+
+
+def test_ttu_is_capped_by_the_token_expiry():
+    user = User(id=1, email="user@example.com", hashed_password="x")
+
+    assert dependencies._token_cache_ttu(b"key", (user, 1_005.0), 1_000.0) == 1_005.0
+    assert dependencies._token_cache_ttu(b"key", (user, 9_999.0), 1_000.0) == 1_000.0 + dependencies.TOKEN_CACHE_TTL_SECONDS
+
+
+def test_cached_user_is_reused(clock, user_lookups):
+    token = security.create_access_token({"sub": "user@example.com"})
+
+    first = _resolve(token)
+    second = _resolve(token)
+
+    assert second is first
+    assert user_lookups == ["user@example.com"]
+
+
+def test_cache_entry_never_outlives_the_token_exp(clock, user_lookups):
+    token = security.create_access_token({"sub": "user@example.com"}, expires_delta=timedelta(minutes=30))
+    exp = security.decode_access_token_claims(token)["exp"]
+    # Why: Start the fake clock close to the token's expiry, well inside the cache TTL.
+    clock.now = exp - 5
+    key = dependencies._token_cache_key(token)
+
+    _resolve(token)
+    clock.now = exp - 0.001
+    assert key in dependencies._token_cache
+
+    clock.now = exp
+    assert key not in dependencies._token_cache
+
+
+def test_cache_entry_expires_after_the_ttl(clock, user_lookups):
+    token = security.create_access_token({"sub": "user@example.com"}, expires_delta=timedelta(minutes=30))
+    key = dependencies._token_cache_key(token)
+
+    _resolve(token)
+    clock.now += dependencies.TOKEN_CACHE_TTL_SECONDS
+    assert key not in dependencies._token_cache
+
+    _resolve(token)
+    assert user_lookups == ["user@example.com", "user@example.com"]
+
+
+def test_invalidated_token_is_resolved_again(clock, user_lookups):
+    token = security.create_access_token({"sub": "user@example.com"})
+
+    _resolve(token)
+    dependencies.invalidate_cached_token(token)
+    _resolve(token)
+
+    assert user_lookups == ["user@example.com", "user@example.com"]
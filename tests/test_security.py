@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+import jwt
+
+from app.core import security
+from config.settings import settings
+
+
+def test_access_token_decodes_with_pyjwt():
+    token = security.create_access_token({"sub": "user@example.com"})
+
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+    assert claims["sub"] == "user@example.com"
+    assert isinstance(claims["exp"], int)
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+
+def test_access_token_matches_pyjwt_encoding():
+    token = security.create_access_token({"sub": "user@example.com", "scope": "tasks"})
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+    # Why: Re-encoding the same claims (in the same order) with PyJWT must give the identical token.
+    assert token == jwt.encode(claims, settings.SECRET_KEY, algorithm="HS256")
+
+
+def test_access_token_with_non_ascii_claims_decodes_with_pyjwt():
+    token = security.create_access_token({"sub": "jürgen@example.com"})
+
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+    assert claims["sub"] == "jürgen@example.com"
+
+
+def test_access_token_signed_with_another_key_is_rejected():
+    token = jwt.encode({"sub": "user@example.com"}, "another-secret-key-for-hs256-signing-01234", algorithm="HS256")
+
+    assert security.decode_access_token_claims(token) is None
+
+
+def test_expired_access_token_is_rejected():
+    token = security.create_access_token({"sub": "user@example.com"}, expires_delta=timedelta(seconds=-1))
+
+    assert security.decode_access_token_claims(token) is None